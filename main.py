@@ -1,28 +1,85 @@
 import os
 import re
-import io
-import sys
+import atexit
+import functools
+import asyncio
+import aiofiles
 import dropbox
 import dropbox.exceptions
-import requests
 import httpx
 import logging
 
-from typing import Union
-from tqdm import tqdm
+from cachetools import TTLCache
 from dropbox import files
-from datetime import datetime
+from pathlib import PurePosixPath
+from datetime import datetime, timezone
+from contextlib import aclosing, closing
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
-from typing import Any, Dict, List, Optional
+from typing import List, Optional
 from dropbox.sharing import SharedLinkSettings, RequestedVisibility
 
 logger = logging.getLogger(__name__)
 load_dotenv()
 mcp = FastMCP("dropbox-service")
-dbx = dropbox.Dropbox(os.getenv("DROPBOX_ACCESS_TOKEN"))
+# The SDK already sleeps for the server's Retry-After on 429s; bound the
+# number of attempts so a throttled call fails instead of blocking forever.
+dbx = dropbox.Dropbox(
+    os.getenv("DROPBOX_ACCESS_TOKEN"), max_retries_on_rate_limit=5
+)
+
+# Shared pooled client for fetching remote files, so repeated URL uploads
+# reuse connections instead of paying a new TCP+TLS handshake every time.
+# The async client used by bulk uploads is built from the same options.
+_HTTP_OPTS = {
+    "http2": True,
+    "timeout": 30.0,
+    "follow_redirects": True,
+    "limits": httpx.Limits(max_keepalive_connections=20, max_connections=100),
+}
+_HTTP = httpx.Client(**_HTTP_OPTS)
+atexit.register(_HTTP.close)
+
+# Allowed characters for rename targets: alphanumeric, dash, underscore, dot, space
+_SAFE_NAME_RE = re.compile(r"^[\w\-. ]+\Z")
+
+# Transfers are streamed in chunks of this size so a file is never held in
+# memory whole. Concurrent upload sessions need appends in multiples of 4 MB.
+_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Write modes accepted by the upload tools. "update" carries a revision, so
+# only the argument-free modes can be built once at import.
+_WRITE_MODES = frozenset(("add", "overwrite", "update"))
+_WRITE_MODE_OBJS = {"add": files.WriteMode.add, "overwrite": files.WriteMode.overwrite}
+
+# Dropbox accepts at most 1000 sessions per upload_session/start_batch and
+# finish_batch call
+_SESSION_BATCH_LIMIT = 1000
+
+# Short-lived cache of folder listings. Any tool that changes files clears it,
+# since a recursive listing of an ancestor folder can go stale too.
+_META_CACHE = TTLCache(maxsize=1024, ttl=60)
+
+
+def _dbx_path(folder, name):
+    """
+    Joins a Dropbox folder and an entry name into a normalized absolute path,
+    e.g. ("docs/", "a.txt") -> "/docs/a.txt".
+
+    name may contain subfolders ("sub/a.txt"); a leading "/" is dropped so it
+    stays inside folder. Raises ValueError if name is empty, only slashes or
+    whitespace, or has a "." or ".." segment, since the join would otherwise
+    resolve to the folder itself or outside it.
+    """
+    relative = name.lstrip("/")
+    if not relative.replace("/", "").strip():
+        raise ValueError(f"Invalid name {name!r}: It cannot be empty.")
+    if any(part in (".", "..") for part in relative.split("/")):
+        raise ValueError(
+            f"Invalid name {name!r}: It must not contain '.' or '..' segments."
+        )
+    return str(PurePosixPath("/", (folder or "").lstrip("/"), relative))
 
-sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8')
 
 @mcp.tool()
 def create_text_file(file_name, content, folder_path=""):
@@ -38,17 +95,15 @@ def create_text_file(file_name, content, folder_path=""):
     if not file_name.endswith(".txt"):
         file_name += ".txt"
 
-    if folder_path and not folder_path.endswith("/"):
-        folder_path += "/"
-
-    full_path = f"{folder_path}{file_name}" if folder_path else f"/{file_name}"
+    full_path = _dbx_path(folder_path, file_name)
 
     try:
         res = dbx.files_upload(
             content.encode("utf-8"), path=full_path, mode=files.WriteMode.add, mute=True
         )
 
-        print(f"✅ File successfully created: `{file_name}` at {full_path}")
+        _META_CACHE.clear()
+        logger.info(f"✅ File successfully created: `{file_name}` at {full_path}")
         return {
             "status": "success",
             "message": "Text File Created ✅",
@@ -70,15 +125,13 @@ def create_folder(folder_name, parent_path="", autorename=True):
     :return: Dropbox response metadata
     """
 
-    if parent_path and not parent_path.endswith("/"):
-        parent_path += "/"
-
-    full_path = f"{parent_path}{folder_name}" if parent_path else f"/{folder_name}"
+    full_path = _dbx_path(parent_path, folder_name)
 
     try:
         res = dbx.files_create_folder_v2(path=full_path, autorename=autorename)
 
-        print(f"✅ Folder successfully created: `{res.metadata.name}` at {full_path}")
+        _META_CACHE.clear()
+        logger.info(f"✅ Folder successfully created: `{res.metadata.name}` at {full_path}")
         return {
             "status": "success",
             "message": "📁 Folder Created ✅",
@@ -92,12 +145,20 @@ def create_folder(folder_name, parent_path="", autorename=True):
 
 def get_file_info(path, new_content):
     """
-    Check if the file exists and return its existing content + new content.
+    Check if the file exists and return its existing content + new content,
+    as UTF-8 bytes ready for upload. new_content may be str or bytes.
+
+    Dropbox has no server-side append, so the existing content has to be
+    downloaded. The download also serves as the existence check: a missing
+    file fails as fast as files_get_metadata would.
     """
+    if isinstance(new_content, str):
+        new_content = new_content.encode("utf-8")
+
     try:
         metadata, res = dbx.files_download(path)
-        existing_content = res.content.decode("utf-8")
-        return True, f"{existing_content}\n{new_content}"
+        # Join as bytes; decoding and re-encoding the existing text is wasted work
+        return True, res.content + b"\n" + new_content
     except dropbox.exceptions.ApiError as e:
         if e.error.is_path() and e.error.get_path().is_not_found():
             return False, new_content
@@ -113,26 +174,24 @@ def create_or_append_to_text_file(file_name, content, folder_path=""):
     if not file_name.endswith(".txt"):
         file_name += ".txt"
 
-    if folder_path and not folder_path.endswith("/"):
-        folder_path += "/"
-
-    full_path = f"{folder_path}{file_name}" if folder_path else f"/{file_name}"
+    full_path = _dbx_path(folder_path, file_name)
 
     # Check file existence and prepare content
     file_exists, final_content = get_file_info(full_path, content)
 
     try:
         res = dbx.files_upload(
-            final_content.encode("utf-8"),
+            final_content,
             full_path,
             mode=files.WriteMode.overwrite,  # Always overwrite with new content
             autorename=not file_exists,  # Autorename only if it's a new file
             mute=True,
         )
+        _META_CACHE.clear()
         if file_exists:
-            print(f"✅ Text successfully appended to the file: {file_name}")
+            logger.info(f"✅ Text successfully appended to the file: {file_name}")
         else:
-            print(f"✅ Text file successfully created at: {full_path}")
+            logger.info(f"✅ Text file successfully created at: {full_path}")
         return {
             "status": "success",
             "message": "Text successfully appended / created to the file ✅",
@@ -144,9 +203,11 @@ def create_or_append_to_text_file(file_name, content, folder_path=""):
         return {"error": str(err)}
 
 
+@functools.lru_cache(maxsize=1)
 def get_account_type():
     """
     Returns the Dropbox account type: 'basic', 'plus', 'business', etc.
+    Cached, since the account type does not change while the server runs.
     """
     res = dbx.users_get_current_account()
     return res.account_type.tag
@@ -182,8 +243,14 @@ def create_or_update_share_link(
 
     # Parse expiration date if provided
     if expires:
-        expire_dt = datetime.fromisoformat(expires.replace("Z", "+00:00"))
-        if expire_dt < datetime.utcnow():
+        # fromisoformat accepts a trailing "Z" on Python 3.11+
+        expire_dt = datetime.fromisoformat(expires)
+        # Treat naive timestamps as UTC; the SDK only accepts UTC datetimes
+        if expire_dt.tzinfo is None:
+            expire_dt = expire_dt.replace(tzinfo=timezone.utc)
+        else:
+            expire_dt = expire_dt.astimezone(timezone.utc)
+        if expire_dt < datetime.now(timezone.utc):
             raise ValueError("Expiration date must be in the future.")
     else:
         expire_dt = None
@@ -197,7 +264,7 @@ def create_or_update_share_link(
 
     try:
         response = dbx.sharing_create_shared_link_with_settings(path, settings)
-        print(f"✅ Shared link created: {response.url}")
+        logger.info(f"✅ Shared link created: {response.url}")
         return {
             "status": "success",
             "message": "Shared link created ✅",
@@ -216,7 +283,8 @@ def delete_file_or_folder(path):
     """
     try:
         response = dbx.files_delete_v2(path)
-        print(f'✅ "{path}" successfully deleted.')
+        _META_CACHE.clear()
+        logger.info(f'✅ "{path}" successfully deleted.')
         return {
             "status": "success",
             "message": "File / Folder Deleted ✅",
@@ -227,16 +295,28 @@ def delete_file_or_folder(path):
         return {"error": str(e)}
 
 
+def _download_to_tmp(path, name=None):
+    """
+    Downloads a Dropbox file into /tmp and returns its metadata and local path.
+    """
+    metadata, res = dbx.files_download(path)
+    ext = os.path.splitext(metadata.name)[1]
+    filename = name if name else f"tmp_{metadata.name}"
+    tmp_path = os.path.join("/tmp", filename)
+
+    # Stream the body to disk instead of holding the whole file in memory
+    with res, open(tmp_path, "wb") as f:
+        for chunk in res.iter_content(chunk_size=_CHUNK_SIZE):
+            f.write(chunk)
+
+    return metadata, tmp_path
+
+
 @mcp.tool()
-def download_file_to_tmp(path, name=None):
+async def download_file_to_tmp(path, name=None):
     try:
-        metadata, res = dbx.files_download(path)
-        ext = os.path.splitext(metadata.name)[1]
-        filename = name if name else f"tmp_{metadata.name}"
-        tmp_path = os.path.join("/tmp", filename)
-
-        with open(tmp_path, "wb") as f:
-            f.write(res.content)
+        # Run the blocking download in a worker thread, off the event loop
+        metadata, tmp_path = await asyncio.to_thread(_download_to_tmp, path, name)
 
         return {
             "message": f"📥 File downloaded to: {tmp_path}",
@@ -247,6 +327,19 @@ def download_file_to_tmp(path, name=None):
         return {"error": str(e)}
 
 
+def _cached_list_folder(path, **kwargs):
+    """
+    Returns files_list_folder results, served from _META_CACHE when the same
+    listing was fetched recently.
+    """
+    key = (path, frozenset(kwargs.items()))
+    res = _META_CACHE.get(key)
+    if res is None:
+        res = dbx.files_list_folder(path=path, **kwargs)
+        _META_CACHE[key] = res
+    return res
+
+
 @mcp.tool()
 def list_files_and_folders(
     path,
@@ -258,8 +351,8 @@ def list_files_and_folders(
     limit=None,
 ):
     try:
-        res = dbx.files_list_folder(
-            path=path,
+        res = _cached_list_folder(
+            path,
             recursive=recursive,
             include_deleted=include_deleted,
             include_has_explicit_shared_members=include_has_explicit_shared_members,
@@ -302,7 +395,7 @@ def list_file_revisions(
         )
         return res.entries
     except dropbox.exceptions.ApiError as e:
-        print(f"API error: {e}")
+        logger.error(f"API error: {e}")
         return {"error": str(e)}
 
 
@@ -328,7 +421,7 @@ def move_file_folder(
     """
     # Extract filename from path_from
     file_name = path_from.rstrip("/").split("/")[-1]
-    destination_path = path_to.rstrip("/") + "/" + file_name
+    destination_path = "/".join((path_to.rstrip("/"), file_name))
 
     try:
         res = dbx.files_move_v2(
@@ -337,10 +430,11 @@ def move_file_folder(
             autorename=autorename,
             allow_ownership_transfer=allow_ownership_transfer,
         )
-        print(f'"{path_from}" successfully moved to "{destination_path}"')
+        _META_CACHE.clear()
+        logger.info(f'"{path_from}" successfully moved to "{destination_path}"')
         return res.metadata
     except dropbox.exceptions.ApiError as e:
-        print(f"Failed to move file/folder: {e}")
+        logger.error(f"Failed to move file/folder: {e}")
         return {"error": str(e)}
 
 
@@ -372,7 +466,7 @@ def rename_file_folder(
         }
 
     # Optional: Allow only safe characters (alphanumeric, dash, underscore, dot, space)
-    if not re.match(r"^[\w\-. ]+$", new_name):
+    if not _SAFE_NAME_RE.match(new_name):
         return {
             "error": "Invalid new_name: Only alphanumeric characters, dashes, underscores, dots, and spaces are allowed."
         }
@@ -389,7 +483,8 @@ def rename_file_folder(
             autorename=autorename,
             allow_ownership_transfer=allow_ownership_transfer,
         )
-        print(f'"{path_from}" successfully renamed to "{new_name}"')
+        _META_CACHE.clear()
+        logger.info(f'"{path_from}" successfully renamed to "{new_name}"')
         return {
             "status": "success",
             "message": "Renaming successful ✅",
@@ -421,10 +516,11 @@ def restore_file(
         return {"error": "Missing revision ID to restore."}
     try:
         res = dbx.files_restore(path=path, rev=rev)
-        print(f"✅ File restored to revision: {rev}")
+        _META_CACHE.clear()
+        logger.info(f"✅ File restored to revision: {rev}")
         return res
     except dropbox.exceptions.ApiError as e:
-        print(f"❌ Failed to restore file: {e}")
+        logger.error(f"❌ Failed to restore file: {e}")
         return {"error": str(e)}
 
 
@@ -435,24 +531,23 @@ def search_files_folders(query: str, max_results: int = 10):
             query, options=dropbox.files.SearchOptions(max_results=max_results)
         )
 
-        matches = (
-            results.matches if hasattr(results, "matches") and results.matches else []
-        )
+        matches = list(results.matches or [])
 
-        formatted_results = []
-        for match in matches:
-            metadata = match.metadata.get_metadata()
-            formatted_results.append(
-                {
-                    "name": metadata.name,
-                    "path_display": metadata.path_display,
-                    "type": (
-                        "folder"
-                        if isinstance(metadata, dropbox.files.FolderMetadata)
-                        else "file"
-                    ),
-                }
-            )
+        # Follow the server-side cursor until enough matches are collected
+        while results.has_more and len(matches) < max_results:
+            results = dbx.files_search_continue_v2(results.cursor)
+            matches.extend(results.matches or [])
+
+        matches_meta = [match.metadata.get_metadata() for match in matches[:max_results]]
+        FolderMetadata = dropbox.files.FolderMetadata
+        formatted_results = [
+            {
+                "name": metadata.name,
+                "path_display": metadata.path_display,
+                "type": "folder" if type(metadata) is FolderMetadata else "file",
+            }
+            for metadata in matches_meta
+        ]
 
         return {
             "matches": formatted_results,
@@ -461,12 +556,66 @@ def search_files_folders(query: str, max_results: int = 10):
         }
 
     except dropbox.exceptions.ApiError as e:
-        print("❌ Search error:", e)
+        logger.error(f"❌ Search error: {e}")
         return {"matches": [], "total_matches": 0, "query": query, "error": str(e)}
 
 
+def _write_mode(mode):
+    """
+    Returns the WriteMode for a mode name, reusing the prebuilt instances.
+    """
+    return _WRITE_MODE_OBJS.get(mode) or dropbox.files.WriteMode(mode)
+
+
+def _iter_chunks(file_url=None, file_path=None):
+    """
+    Yields the content of a remote or local file in _CHUNK_SIZE pieces.
+    """
+    if file_url:
+        with _HTTP.stream("GET", file_url) as response:
+            response.raise_for_status()
+            yield from response.iter_bytes(chunk_size=_CHUNK_SIZE)
+    else:
+        with open(file_path, "rb") as f:
+            while chunk := f.read(_CHUNK_SIZE):
+                yield chunk
+
+
+def _upload_stream(file_url, file_path, dropbox_path, commit_args):
+    """
+    Uploads a remote or local file to dropbox_path, going through an upload
+    session when it is larger than a single chunk.
+    """
+    with closing(_iter_chunks(file_url, file_path)) as chunks:
+        chunk = next(chunks, b"")
+        next_chunk = next(chunks, None)
+
+        if next_chunk is None:
+            # Fits in a single chunk, upload the file in one request
+            res = dbx.files_upload(chunk, dropbox_path, **commit_args)
+        else:
+            # Stream the file through an upload session chunk by chunk
+            start = dbx.files_upload_session_start(chunk)
+            cursor = files.UploadSessionCursor(
+                session_id=start.session_id, offset=len(chunk)
+            )
+            chunk = next_chunk
+            for next_chunk in chunks:
+                dbx.files_upload_session_append_v2(chunk, cursor)
+                cursor.offset += len(chunk)
+                chunk = next_chunk
+
+            res = dbx.files_upload_session_finish(
+                chunk,
+                cursor,
+                files.CommitInfo(path=dropbox_path, **commit_args),
+            )
+
+    return res
+
+
 @mcp.tool()
-def upload_file_to_dropbox(
+async def upload_file_to_dropbox(
     file_url: Optional[str] = None,
     file_path: Optional[str] = None,
     dropbox_folder_path: str = "",
@@ -498,49 +647,106 @@ def upload_file_to_dropbox(
     if not file_url and not file_path:
         raise ValueError("Must specify either file_url or file_path.")
 
-    try:
-        # Get file content
-        if file_url:
-            response = requests.get(file_url, stream=True)
-            response.raise_for_status()
-            contents = response.content
-        else:
-            with open(file_path, "rb") as f:
-                contents = f.read()
-
-        # Ensure Dropbox path formatting
-        dropbox_path = f"{dropbox_folder_path.rstrip('/')}/{file_name}"
+    dropbox_path = _dbx_path(dropbox_folder_path, file_name)
 
+    try:
         # Prepare mode tag
-        mode_tag = {"add", "overwrite", "update"}
-        upload_mode = (
-            {"mode": dropbox.files.WriteMode(mode)} if mode in mode_tag else {}
-        )
-
-        # Upload the file
-        res = dbx.files_upload(
-            contents,
-            dropbox_path,
-            autorename=autorename,
-            mute=mute,
-            strict_conflict=strict_conflict,
-            client_modified=client_modified,
+        upload_mode = {"mode": _write_mode(mode)} if mode in _WRITE_MODES else {}
+        commit_args = {
+            "autorename": autorename,
+            "mute": mute,
+            "strict_conflict": strict_conflict,
+            "client_modified": client_modified,
             **upload_mode,
+        }
+
+        # The transfer blocks on network and disk I/O, so keep it off the
+        # event loop that serves the other tool calls
+        res = await asyncio.to_thread(
+            _upload_stream, file_url, file_path, dropbox_path, commit_args
         )
 
-        print(f"✅ File successfully uploaded to '{dropbox_path}'")
+        _META_CACHE.clear()
+        logger.info(f"✅ File successfully uploaded to '{dropbox_path}'")
         return res
 
     except dropbox.exceptions.ApiError as e:
-        print("❌ Dropbox API error:", e)
+        logger.error(f"❌ Dropbox API error: {e}")
         return {"error": str(e)}
     except Exception as e:
-        print("❌ Error:", e)
+        logger.error(f"❌ Error: {e}")
         return {"error": str(e)}
 
 
+async def _aiter_chunks(session, source, from_url):
+    """
+    Asynchronously yields the content of a remote or local file in
+    _CHUNK_SIZE pieces.
+    """
+    if from_url:
+        async with session.stream("GET", source) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size=_CHUNK_SIZE):
+                yield chunk
+    else:
+        async with aiofiles.open(source, "rb") as f:
+            while chunk := await f.read(_CHUNK_SIZE):
+                yield chunk
+
+
+async def _upload_one(
+    session, source, from_url, session_id, dropbox_path, sem, **upload_args
+):
+    """
+    Streams a single file from a URL or local path into an already started
+    concurrent upload session. The semaphore bounds how many transfers run at
+    the same time.
+
+    Returns the UploadSessionFinishArg needed to commit the file.
+    """
+    async with sem:
+        cursor = files.UploadSessionCursor(session_id=session_id, offset=0)
+
+        # The Dropbox SDK is synchronous, so run the calls in a worker thread.
+        # Hold back one chunk so the final append can close the session, and
+        # keep one append in flight while the next chunk is being read.
+        # Concurrent sessions accept appends in any order.
+        chunk = b""
+        append = None
+        try:
+            async with aclosing(_aiter_chunks(session, source, from_url)) as chunks:
+                async for next_chunk in chunks:
+                    if chunk:
+                        if append is not None:
+                            await append
+                        append = asyncio.ensure_future(
+                            asyncio.to_thread(
+                                dbx.files_upload_session_append_v2,
+                                chunk,
+                                files.UploadSessionCursor(
+                                    session_id=cursor.session_id, offset=cursor.offset
+                                ),
+                            )
+                        )
+                        cursor.offset += len(chunk)
+                    chunk = next_chunk
+        finally:
+            if append is not None:
+                await append
+
+        await asyncio.to_thread(
+            dbx.files_upload_session_append_v2, chunk, cursor, close=True
+        )
+        cursor.offset += len(chunk)
+
+        return files.UploadSessionFinishArg(
+            cursor=cursor,
+            commit=files.CommitInfo(path=dropbox_path, **upload_args),
+        )
+
+
 @mcp.tool()
-def upload_multiple_files_to_dropbox(
+async def upload_multiple_files_to_dropbox(
     file_urls: Optional[List[str]] = None,
     file_paths: Optional[List[str]] = None,
     filenames: Optional[List[str]] = None,
@@ -549,6 +755,7 @@ def upload_multiple_files_to_dropbox(
     mute: bool = False,
     strict_conflict: bool = False,
     mode: Optional[str] = None,
+    concurrency: int = 10,
 ):
     """
     Uploads multiple files to a Dropbox folder from URLs and/or local paths.
@@ -563,9 +770,11 @@ def upload_multiple_files_to_dropbox(
         mute (bool): Suppress notifications.
         strict_conflict (bool): Be strict about conflict detection.
         mode (str, optional): Write mode ('add', 'overwrite', 'update').
+        concurrency (int): Maximum number of files transferred at the same time.
 
     Returns:
-        List[dropbox.files.FileMetadata]: Uploaded file metadata list or error info.
+        List[dropbox.files.FileMetadata]: Uploaded file metadata list, with an
+        error entry in place of each file that failed.
     """
 
     file_urls = file_urls or []
@@ -579,50 +788,75 @@ def upload_multiple_files_to_dropbox(
             f"Number of filenames ({len(filenames)}) must match total files ({total_files})."
         )
 
-    responses = []
-    index = 0
+    # URLs first, then local paths, matching the order of filenames
+    sources = [(url, True) for url in file_urls] + [
+        (path, False) for path in file_paths
+    ]
+    dropbox_paths = [_dbx_path(dropbox_folder_path, name) for name in filenames]
 
     try:
-        # Upload from URLs
-        for url in file_urls:
-            response = requests.get(url)
-            response.raise_for_status()
-            content = response.content
-
-            dropbox_path = f"{dropbox_folder_path.rstrip('/')}/{filenames[index]}"
-            result = dbx.files_upload(
-                content,
-                dropbox_path,
-                autorename=autorename,
-                mute=mute,
-                strict_conflict=strict_conflict,
-                mode=dropbox.files.WriteMode(mode) if mode else None,
+        upload_args = {
+            "autorename": autorename,
+            "mute": mute,
+            "strict_conflict": strict_conflict,
+            "mode": _write_mode(mode) if mode else None,
+        }
+        sem = asyncio.Semaphore(max(1, concurrency))
+
+        # Open the upload sessions in bulk rather than one request per file
+        session_ids = []
+        for batch_start in range(0, total_files, _SESSION_BATCH_LIMIT):
+            started = await asyncio.to_thread(
+                dbx.files_upload_session_start_batch,
+                num_sessions=min(_SESSION_BATCH_LIMIT, total_files - batch_start),
+                session_type=files.UploadSessionType.concurrent,
             )
-            responses.append(result)
-            index += 1
-
-        # Upload from local file paths
-        for path in file_paths:
-            with open(path, "rb") as f:
-                content = f.read()
-
-            dropbox_path = f"{dropbox_folder_path.rstrip('/')}/{filenames[index]}"
-            result = dbx.files_upload(
-                content,
-                dropbox_path,
-                autorename=autorename,
-                mute=mute,
-                strict_conflict=strict_conflict,
-                mode=dropbox.files.WriteMode(mode) if mode else None,
+            session_ids.extend(started.session_ids)
+
+        async with httpx.AsyncClient(**_HTTP_OPTS) as session:
+            tasks = [
+                _upload_one(
+                    session,
+                    source,
+                    from_url,
+                    session_id,
+                    dropbox_path,
+                    sem,
+                    **upload_args,
+                )
+                for (source, from_url), session_id, dropbox_path in zip(
+                    sources, session_ids, dropbox_paths
+                )
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        responses = [
+            {"error": str(res)} if isinstance(res, Exception) else None
+            for res in results
+        ]
+
+        # Commit every uploaded session in as few requests as possible
+        pending = [
+            (i, res) for i, res in enumerate(results) if not isinstance(res, Exception)
+        ]
+        for batch_start in range(0, len(pending), _SESSION_BATCH_LIMIT):
+            batch = pending[batch_start : batch_start + _SESSION_BATCH_LIMIT]
+            finished = await asyncio.to_thread(
+                dbx.files_upload_session_finish_batch_v2, [arg for _, arg in batch]
             )
-            responses.append(result)
-            index += 1
-
-        print("✅ Files successfully uploaded to Dropbox.")
+            for (i, _), entry in zip(batch, finished.entries):
+                responses[i] = (
+                    entry.get_success()
+                    if entry.is_success()
+                    else {"error": str(entry.get_failure())}
+                )
+
+        _META_CACHE.clear()
+        logger.info("✅ Files successfully uploaded to Dropbox.")
         return responses
 
     except Exception as e:
-        print("❌ Upload error:", e)
+        logger.error(f"❌ Upload error: {e}")
         return [{"error": str(e)}]
 
 